@@ -7,7 +7,8 @@
 #
 # What this DAG does conceptually:
 # 1) (Optional) Generate synthetic banking data
-# 2) Run the ETL pipeline to build warehouse tables:
+# 2) Extract the raw data once into a shared staging area
+# 3) Build the warehouse tables in parallel (independent tasks):
 #    - dim_users
 #    - fct_funnel
 #    - fct_transactions
@@ -17,6 +18,12 @@
 # - It is NOT required to run this project locally.
 # - To actually run this DAG, an Airflow instance must be configured
 #   with the project code available on its PYTHONPATH.
+# - The three builder tasks run in the "etl_cpu" pool, which must exist
+#   with 3 slots so they can run at the same time:
+#     airflow pools set etl_cpu 3 "Parallel ETL builder tasks"
+# - The staged raw tables (data/staging/*.arrow) are read by all builder
+#   tasks, so data/staging/ must be on a volume shared by the workers
+#   (e.g. NFS/EFS) when they run on different machines.
 # =====================================================================
 
 from datetime import datetime, timedelta
@@ -36,7 +43,12 @@ sys.path.append(str(project_root))
 
 # Now we can import the ETL functions from the project
 from etl.generate_fake_data import main as generate_fake_data_main
-from etl.etl_pipeline import run_etl
+from etl.etl_pipeline import (
+    build_dim_users_task,
+    build_fct_funnel_task,
+    build_fct_transactions_task,
+    extract_to_staging,
+)
 
 
 # ---------------------------------------------------------------------
@@ -77,16 +89,44 @@ with DAG(
     )
 
     # -------------------------------------------------------------
-    # Task 2: Run the ETL pipeline
+    # Task 2: Extract raw data into the staging area
     # -------------------------------------------------------------
-    run_etl_task = PythonOperator(
-        task_id="run_etl_pipeline",
-        python_callable=run_etl,
+    extract_task = PythonOperator(
+        task_id="extract_to_staging",
+        python_callable=extract_to_staging,
+    )
+
+    # -------------------------------------------------------------
+    # Tasks 3-5: Build the warehouse tables (in parallel)
+    # -------------------------------------------------------------
+    # Each builder only needs the staged raw tables, not the other builders,
+    # so they share the "etl_cpu" pool (3 slots) and run concurrently.
+    build_dim_users_op = PythonOperator(
+        task_id="build_dim_users",
+        python_callable=build_dim_users_task,
+        pool="etl_cpu",
+    )
+
+    build_fct_transactions_op = PythonOperator(
+        task_id="build_fct_transactions",
+        python_callable=build_fct_transactions_task,
+        pool="etl_cpu",
+    )
+
+    build_fct_funnel_op = PythonOperator(
+        task_id="build_fct_funnel",
+        python_callable=build_fct_funnel_task,
+        pool="etl_cpu",
     )
 
     # -------------------------------------------------------------
     # Task dependencies (order of execution)
     # -------------------------------------------------------------
     # First: generate fake data
-    # Then: run ETL on that data
-    generate_fake_data_task >> run_etl_task
+    # Then: stage the raw data once
+    # Finally: fan out to the three independent builders
+    generate_fake_data_task >> extract_task >> [
+        build_dim_users_op,
+        build_fct_transactions_op,
+        build_fct_funnel_op,
+    ]
@@ -2,20 +2,27 @@
 Simple ETL pipeline for the Revolut Growth Analytics project.
 
 Goal:
-- Read raw CSVs from data/raw/  (Extract)
+- Read raw Parquet files from data/raw/  (Extract)
 - Clean and transform them into analytics-friendly tables (Transform)
 - Save the result as Parquet files in data/warehouse/  (Load)
 
 Resulting warehouse tables:
 - dim_users.parquet        (user-level dimension table)
-- fct_transactions.parquet (transaction-level fact table)
+- fct_transactions/        (transaction-level fact table, partitioned by
+                            transaction_date: fct_transactions/transaction_date=YYYY-MM-DD/)
 - fct_funnel.parquet       (funnel event fact table)
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import shutil
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
 
 # ----------------------------------------
 # Setup: paths and basic config
@@ -27,44 +34,65 @@ import pandas as pd
 # BASE_DIR = project root folder (one level above /etl)
 BASE_DIR = Path(__file__).resolve().parents[1]
 
-# Folder for raw CSVs (output of generate_fake_data.py)
+# Folder for raw Parquet files (output of generate_fake_data.py)
 RAW_DIR = BASE_DIR / "data" / "raw"
 
+# Folder for staged raw tables (shared between the parallel Airflow builder tasks)
+# When tasks run on different Airflow workers, this must be a shared volume.
+STAGING_DIR = BASE_DIR / "data" / "staging"
+
 # Folder for warehouse tables (cleaned & modeled)
 WAREHOUSE_DIR = BASE_DIR / "data" / "warehouse"
 WAREHOUSE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Time constants for duration metrics
+# - timestamps are stored as int64 nanoseconds
+# - NaT (missing timestamp) is the smallest possible int64
+NS_PER_HOUR = 3_600 * 1_000_000_000
+HOURS_PER_NS = 1.0 / NS_PER_HOUR
+NAT_NS = np.iinfo(np.int64).min
+
 
 # ----------------------------------------
-# Helper: load all raw CSVs
+# Helper: load raw Parquet files
 # ----------------------------------------
 # Purpose:
 # - Keep file loading in one place
-# - Ensure date columns are parsed as real datetimes
-
-def load_raw_data():
-    """Load all raw CSVs from data/raw/ as DataFrames."""
-    users = pd.read_csv(RAW_DIR / "users.csv", parse_dates=["signup_at"])
-
-    kyc = pd.read_csv(
-        RAW_DIR / "kyc.csv",
-        parse_dates=["kyc_started_at", "kyc_completed_at"],
-    )
-
-    cards = pd.read_csv(
-        RAW_DIR / "cards.csv",
-        parse_dates=["card_activated_at"],
-    )
+# - Parquet stores real dtypes, so date columns are already datetimes
+#   (no parse_dates / re-parsing needed like with CSV)
+# - Low-cardinality text columns (a handful of distinct values each) are
+#   cast to "category": small integer codes instead of Python strings,
+#   which saves memory and speeds up groupby / merge
+# - Parquet is columnar, so passing `columns` skips the other columns
+#   on disk entirely (column pruning) → only read what a builder needs
+
+# Low-cardinality text columns per raw table
+CATEGORY_COLUMNS = {
+    "users": ["country", "device", "marketing_channel"],
+    "kyc": ["kyc_status"],
+    "cards": ["card_type"],
+    "transactions": ["category", "merchant_country", "transaction_type"],
+    "funnel_events": ["step_name"],
+}
+
+# Columns the builders actually use from the wider raw tables
+DIM_USERS_TRANSACTION_COLUMNS = ["user_id", "transaction_time", "amount_eur"]
+FCT_FUNNEL_COLUMNS = ["user_id", "step_order", "step_name", "event_time"]
+
+
+def load_raw_table(name, columns=None):
+    """Load one raw Parquet table (optionally only some columns) from data/raw/."""
+    df = pd.read_parquet(RAW_DIR / f"{name}.parquet", columns=columns)
+    return df.astype({col: "category" for col in CATEGORY_COLUMNS[name] if col in df})
 
-    transactions = pd.read_csv(
-        RAW_DIR / "transactions.csv",
-        parse_dates=["transaction_time"],
-    )
 
-    funnel = pd.read_csv(
-        RAW_DIR / "funnel_events.csv",
-        parse_dates=["event_time"],
-    )
+def load_raw_data():
+    """Load all raw Parquet files from data/raw/ as DataFrames."""
+    users = load_raw_table("users")
+    kyc = load_raw_table("kyc")
+    cards = load_raw_table("cards")
+    transactions = load_raw_table("transactions")
+    funnel = load_raw_table("funnel_events", columns=FCT_FUNNEL_COLUMNS)
 
     return users, kyc, cards, transactions, funnel
 
@@ -82,30 +110,36 @@ def load_raw_data():
 #   - derived durations between steps
 #
 # Pattern used for each source table (kyc, cards, transactions):
-# 1. Sort by a time column (e.g. kyc_started_at, card_activated_at, transaction_time)
-# 2. Group by user_id
-# 3. Aggregate:
+# 1. Group by user_id (no pre-sort needed, sort=False skips sorting the result,
+#    observed=True avoids expanding unused categories)
+# 2. Aggregate:
 #    - use "min" for "first time"
-#    - use "last" for "final status" or "latest type"
-# 4. Merge the aggregated result into dim_users on user_id
+#    - for "final status" or "latest type", pick the row with the latest
+#      timestamp per user via idxmax (same result as sort + "last",
+#      without sorting the whole table), looked up by row position
+#      (index reset first, so a non-unique input index, e.g. from
+#      pd.concat without ignore_index, cannot pick the wrong rows)
+#    - idxmax only sees rows that have a timestamp; users whose rows are
+#      all NaT keep the plain "last" value (what sort + "last" returned)
+# 3. Join all aggregated results onto the users table in ONE pass
+#    (user_id as index on every side → a single aligned column-concat
+#    instead of three separate merges that each rebuild the whole table)
 
 def build_dim_users(users, kyc, cards, transactions, funnel):
     """Create the dim_users table with one row per user and summary metrics."""
-    # Start from the users table (one row per user already)
-    dim = users.copy()
+    # Row labels = row positions for the idxmax lookups below
+    kyc = kyc.reset_index(drop=True)
+    cards = cards.reset_index(drop=True)
 
     # -----------------------------
     # KYC summary per user
     # -----------------------------
-    # Step 1: sort by kyc_started_at so that "min"/"last" aggregations behave predictably
-    kyc_sorted = kyc.sort_values("kyc_started_at")
-
-    # Step 2: group by user_id and aggregate
+    # Step 1: group by user_id and aggregate
     # - "min" on a datetime column → earliest timestamp
-    # - "last" on kyc_status → last value in the time order (final outcome)
+    # - "last" on kyc_status → fallback status, overwritten in Step 2
     kyc_agg = (
-        kyc_sorted
-        .groupby("user_id", as_index=False)
+        kyc
+        .groupby("user_id", sort=False, observed=True)
         .agg(
             first_kyc_started_at=("kyc_started_at", "min"),
             first_kyc_completed_at=("kyc_completed_at", "min"),
@@ -113,53 +147,67 @@ def build_dim_users(users, kyc, cards, transactions, funnel):
         )
     )
 
+    # Step 2: final KYC status = status of the latest KYC attempt
+    # idxmax raises on a group with only NaT timestamps, so it only gets the
+    # rows with a kyc_started_at; users without any keep the "last" status
+    latest_kyc_row = (
+        kyc.dropna(subset=["kyc_started_at"])
+        .groupby("user_id", sort=False, observed=True)["kyc_started_at"]
+        .idxmax()
+    )
+    kyc_agg.loc[latest_kyc_row.index, "kyc_status"] = (
+        kyc["kyc_status"].iloc[latest_kyc_row.to_numpy()].to_numpy()
+    )
+
     # Step 3: boolean flag if user ever had KYC approved
+    # (kyc_status is categorical, so this compares integer codes, not strings)
     kyc_agg["has_kyc_approved"] = kyc_agg["kyc_status"].eq("APPROVED")
 
-    # Step 4: merge KYC summary into dim_users
-    dim = dim.merge(kyc_agg, on="user_id", how="left")
-
     # -----------------------------
     # Card summary per user
     # -----------------------------
     # Same pattern:
-    # 1. sort by activation time
-    # 2. group by user_id
-    # 3. aggregate first activation time and "last" card_type
-    cards_sorted = cards.sort_values("card_activated_at")
-
+    # 1. group by user_id → first activation time + fallback card_type
+    # 2. card_type of the latest activated card (looked up by its row);
+    #    users with no activated card keep the "last" card_type
     cards_agg = (
-        cards_sorted
-        .groupby("user_id", as_index=False)
+        cards
+        .groupby("user_id", sort=False, observed=True)
         .agg(
             card_activated_at=("card_activated_at", "min"),
             card_type=("card_type", "last"),
         )
     )
 
-    # has_card_activated = True if card_activated_at is NOT null
-    # .isna()  → True where value is missing
-    # ~.isna() → True where value is present (tilde ~ negates the boolean Series)
-    cards_agg["has_card_activated"] = ~cards_agg["card_activated_at"].isna()
+    latest_card_row = (
+        cards.dropna(subset=["card_activated_at"])
+        .groupby("user_id", sort=False, observed=True)["card_activated_at"]
+        .idxmax()
+    )
+    cards_agg.loc[latest_card_row.index, "card_type"] = (
+        cards["card_type"].iloc[latest_card_row.to_numpy()].to_numpy()
+    )
 
-    # Merge card info into dim_users
-    dim = dim.merge(cards_agg, on="user_id", how="left")
+    # has_card_activated = True if card_activated_at is NOT null
+    # → False for users whose cards were never activated (all NaT: "min"
+    #   gives NaT, and the latest-card lookup above skips those users)
+    # NaT is the smallest int64 in the underlying nanoseconds, so one
+    # comparison on the raw array replaces .isna() + negation (~)
+    cards_agg["has_card_activated"] = (
+        cards_agg["card_activated_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+        != NAT_NS
+    )
 
     # -----------------------------
     # First top-up / transaction per user
     # -----------------------------
-    # Again same pattern:
-    # 1. sort by transaction_time
-    # 2. group by user_id
-    # 3. aggregate:
+    # Only order-independent aggregations here, so a single groupby is enough:
     #    - first_transaction_at → earliest (min) transaction_time
     #    - total_transactions  → count of transactions
     #    - total_amount_eur    → sum of amounts
-    tx_sorted = transactions.sort_values("transaction_time")
-
     tx_agg = (
-        tx_sorted
-        .groupby("user_id", as_index=False)
+        transactions
+        .groupby("user_id", as_index=False, sort=False, observed=True)
         .agg(
             first_transaction_at=("transaction_time", "min"),
             total_transactions=("transaction_time", "count"),
@@ -168,37 +216,61 @@ def build_dim_users(users, kyc, cards, transactions, funnel):
     )
 
     # has_topup = True if user has at least one transaction (first_transaction_at not null)
-    tx_agg["has_topup"] = ~tx_agg["first_transaction_at"].isna()
+    tx_agg["has_topup"] = (
+        tx_agg["first_transaction_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+        != NAT_NS
+    )
 
-    # Merge transaction summary into dim_users
-    dim = dim.merge(tx_agg, on="user_id", how="left")
+    # -----------------------------
+    # Combine everything into dim_users
+    # -----------------------------
+    # Start from the users table (one row per user already) and left-join
+    # all three summaries at once on the user_id index.
+    # Users without KYC / card / transactions get missing values.
+    dim = (
+        users.set_index("user_id")
+        .join(
+            [
+                kyc_agg,
+                cards_agg,
+                tx_agg.set_index("user_id"),
+            ],
+            how="left",
+        )
+        .reset_index()
+    )
 
     # -----------------------------
     # Time-based metrics (durations)
     # -----------------------------
     # We compute durations in HOURS between important steps.
-    # Using dt.total_seconds() gives us seconds → divide by 3600 to get hours.
+    # Timestamps are int64 nanoseconds under the hood, so we take that int64
+    # view of each column once, subtract plain integers and scale to hours.
+    # NaT is stored as the smallest int64 → those rows become NaN.
+    signup_ns = dim["signup_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+    kyc_ns = dim["first_kyc_completed_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+    card_ns = dim["card_activated_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+    tx_ns = dim["first_transaction_at"].to_numpy(dtype="datetime64[ns]").view("i8")
+
+    signup_nat = signup_ns == NAT_NS
+    kyc_nat = kyc_ns == NAT_NS
+    card_nat = card_ns == NAT_NS
+    tx_nat = tx_ns == NAT_NS
 
     # Time from signup to first KYC completion
-    dim["time_to_kyc_hours"] = (
-        (dim["first_kyc_completed_at"] - dim["signup_at"])
-        .dt.total_seconds()
-        .div(3600)
-    )
+    time_to_kyc = (kyc_ns - signup_ns) * HOURS_PER_NS
+    time_to_kyc[kyc_nat | signup_nat] = np.nan
+    dim["time_to_kyc_hours"] = time_to_kyc
 
     # Time from KYC completion to card activation
-    dim["time_kyc_to_card_hours"] = (
-        (dim["card_activated_at"] - dim["first_kyc_completed_at"])
-        .dt.total_seconds()
-        .div(3600)
-    )
+    time_kyc_to_card = (card_ns - kyc_ns) * HOURS_PER_NS
+    time_kyc_to_card[card_nat | kyc_nat] = np.nan
+    dim["time_kyc_to_card_hours"] = time_kyc_to_card
 
     # Time from card activation to first transaction (approx. first top-up)
-    dim["time_card_to_first_tx_hours"] = (
-        (dim["first_transaction_at"] - dim["card_activated_at"])
-        .dt.total_seconds()
-        .div(3600)
-    )
+    time_card_to_first_tx = (tx_ns - card_ns) * HOURS_PER_NS
+    time_card_to_first_tx[tx_nat | card_nat] = np.nan
+    dim["time_card_to_first_tx_hours"] = time_card_to_first_tx
 
     return dim
 
@@ -213,14 +285,23 @@ def build_dim_users(users, kyc, cards, transactions, funnel):
 
 def build_fct_transactions(transactions):
     """Create a cleaned transaction fact table."""
-    fct_tx = transactions.copy()
+    # Shallow copy: shares the existing column data with `transactions`
+    # instead of duplicating the whole table in memory. Assigning a column
+    # below replaces it in fct_tx only, so the input frame stays unchanged.
+    fct_tx = transactions.copy(deep=False)
 
     # Ensure amount is float
-    fct_tx["amount_eur"] = fct_tx["amount_eur"].astype(float)
+    # float32 is plenty for amounts like 5–80€ with 2 decimals and halves the
+    # bytes on disk / in memory compared to float64
+    fct_tx["amount_eur"] = fct_tx["amount_eur"].astype("float32")
 
     # Simple time dimensions for grouping later (e.g. by day, by hour)
-    fct_tx["transaction_date"] = fct_tx["transaction_time"].dt.date
-    fct_tx["transaction_hour"] = fct_tx["transaction_time"].dt.hour
+    # - date: truncate the timestamp to whole days (stays a native datetime64
+    #   column instead of one Python date object per row)
+    # - hour: integer math on the int64 nanoseconds (ns → hours, mod 24)
+    tx_time = fct_tx["transaction_time"].to_numpy(dtype="datetime64[ns]")
+    fct_tx["transaction_date"] = tx_time.astype("datetime64[D]")
+    fct_tx["transaction_hour"] = ((tx_time.view("i8") // NS_PER_HOUR) % 24).astype("int8")
 
     return fct_tx
 
@@ -235,24 +316,171 @@ def build_fct_transactions(transactions):
 
 def build_fct_funnel(funnel):
     """Create a cleaned funnel fact table."""
-    fct_funnel = funnel.copy()
+    # Work on an Arrow table: its multi-key sort is multithreaded C++ on
+    # typed column buffers (faster than pandas sort_values on mixed dtypes)
+    tbl = pa.Table.from_pandas(funnel, preserve_index=False)
 
     # step_order should be an integer
-    fct_funnel["step_order"] = fct_funnel["step_order"].astype(int)
+    # Use the smallest integer types that fit the data:
+    # - step_order is 1–5 → int8
+    # - user_id fits comfortably in int32
+    for col, col_type in [("step_order", pa.int8()), ("user_id", pa.int32())]:
+        pos = tbl.schema.get_field_index(col)
+        tbl = tbl.set_column(pos, col, pc.cast(tbl[col], col_type))
 
     # Sort by user and step for readability and consistent analysis
-    fct_funnel = fct_funnel.sort_values(
-        ["user_id", "step_order", "event_time"]
-    ).reset_index(drop=True)
+    sort_idx = pc.sort_indices(
+        tbl,
+        sort_keys=[
+            ("user_id", "ascending"),
+            ("step_order", "ascending"),
+            ("event_time", "ascending"),
+        ],
+    )
+    fct_funnel = tbl.take(sort_idx).to_pandas()
 
     return fct_funnel
 
 
+# ----------------------------------------
+# Helper: write one warehouse table
+# ----------------------------------------
+# Purpose:
+# - Same Parquet settings for every warehouse table
+#   (zstd + dictionary encoding, so repeated strings like step_name or
+#   category are stored once and referenced by small integer codes)
+# - pyarrow releases the GIL while encoding/compressing, so several
+#   tables can be written at the same time from different threads
+# - fct_transactions keeps growing over time, so it is written as a Hive-style
+#   partitioned dataset (one folder per transaction_date). Readers that filter
+#   on a date range only open the matching folders (partition pruning), e.g.:
+#     ds.dataset(WAREHOUSE_DIR / "fct_transactions", format="parquet",
+#                partitioning=ds.partitioning(
+#                    WAREHOUSE_PARTITIONS["fct_transactions"], flavor="hive"))
+#       .to_table(filter=ds.field("transaction_date") >= date(2024, 6, 1))
+
+# Partition columns per warehouse table (tables not listed → single file)
+WAREHOUSE_PARTITIONS = {
+    "fct_transactions": pa.schema([("transaction_date", pa.date32())]),
+}
+
+
+def write_warehouse_table(df, name):
+    """Write one warehouse table to data/warehouse/ (<name>.parquet or <name>/)."""
+    if name in WAREHOUSE_PARTITIONS:
+        partition_schema = WAREHOUSE_PARTITIONS[name]
+        tbl = pa.Table.from_pandas(df, preserve_index=False)
+
+        # partition columns must have the type declared in the partition schema
+        for field in partition_schema:
+            pos = tbl.schema.get_field_index(field.name)
+            tbl = tbl.set_column(pos, field.name, pc.cast(tbl[field.name], field.type))
+
+        # Full rebuild like the single-file tables: remove all old partitions
+        # first, otherwise days that are missing from the new data would stay
+        # behind and keep their rows from earlier runs
+        shutil.rmtree(WAREHOUSE_DIR / name, ignore_errors=True)
+
+        # Known failure: ds.write_dataset deadlocks the interpreter (the process
+        # hangs on exit) when it runs inside a ThreadPoolExecutor, or on the
+        # main thread while pool threads have already used pyarrow. So the
+        # dataset writer runs single-threaded (use_threads=False) and run_etl
+        # calls it on the main thread BEFORE starting its thread pool.
+        ds.write_dataset(
+            tbl,
+            WAREHOUSE_DIR / name,
+            format="parquet",
+            partitioning=ds.partitioning(partition_schema, flavor="hive"),
+            file_options=ds.ParquetFileFormat().make_write_options(
+                compression="zstd",
+                use_dictionary=True,
+            ),
+            existing_data_behavior="error",
+            use_threads=False,
+        )
+        return
+
+    df.to_parquet(
+        WAREHOUSE_DIR / f"{name}.parquet",
+        index=False,
+        engine="pyarrow",
+        compression="zstd",
+        use_dictionary=True,
+    )
+
+
+# ----------------------------------------
+# Airflow task entry points
+# ----------------------------------------
+# Purpose:
+# - Split the ETL into independent steps so Airflow can run them in parallel:
+#   1. extract_to_staging() loads the raw data once and stages it as
+#      uncompressed Arrow IPC (Feather v2) files
+#   2. the three builder tasks each read only the staged tables/columns they
+#      need, build one warehouse table and write it
+# - The builders do not depend on each other, only on the staging step
+# - Arrow IPC files are memory-mapped on read: no parsing or decompression,
+#   column data is used straight from the (OS-cached) file
+
+def extract_to_staging():
+    """Load all raw data and stage it in data/staging/ for the builder tasks."""
+    STAGING_DIR.mkdir(parents=True, exist_ok=True)
+
+    users, kyc, cards, transactions, funnel = load_raw_data()
+    staged = {
+        "users": users,
+        "kyc": kyc,
+        "cards": cards,
+        "transactions": transactions,
+        "funnel": funnel,
+    }
+    for name, df in staged.items():
+        feather.write_feather(
+            pa.Table.from_pandas(df, preserve_index=False),
+            STAGING_DIR / f"{name}.arrow",
+            compression="uncompressed",
+        )
+
+
+def read_staging(name, columns=None):
+    """Read one staged table (optionally only some columns) from data/staging/."""
+    return feather.read_table(
+        STAGING_DIR / f"{name}.arrow",
+        columns=columns,
+        memory_map=True,
+    ).to_pandas()
+
+
+def build_dim_users_task():
+    """Build dim_users from the staged tables and write it to the warehouse."""
+    dim_users = build_dim_users(
+        read_staging("users"),
+        read_staging("kyc"),
+        read_staging("cards"),
+        read_staging("transactions", columns=DIM_USERS_TRANSACTION_COLUMNS),
+        funnel=None,  # not used by build_dim_users
+    )
+    write_warehouse_table(dim_users, "dim_users")
+
+
+def build_fct_transactions_task():
+    """Build fct_transactions from the staged tables and write it to the warehouse."""
+    fct_transactions = build_fct_transactions(read_staging("transactions"))
+    write_warehouse_table(fct_transactions, "fct_transactions")
+
+
+def build_fct_funnel_task():
+    """Build fct_funnel from the staged tables and write it to the warehouse."""
+    fct_funnel = build_fct_funnel(read_staging("funnel", columns=FCT_FUNNEL_COLUMNS))
+    write_warehouse_table(fct_funnel, "fct_funnel")
+
+
 # ----------------------------------------
 # Main ETL flow
 # ----------------------------------------
 # Purpose:
-# - Orchestrate the full ETL process:
+# - Orchestrate the full ETL process in one go (e.g. when running locally;
+#   the Airflow DAG uses the task entry points above instead):
 #   1. Load raw data
 #   2. Build dim_users, fct_transactions, fct_funnel
 #   3. Save them as Parquet into data/warehouse/
@@ -272,15 +500,33 @@ def run_etl():
     fct_funnel = build_fct_funnel(funnel)
 
     # Save as Parquet files (simulated warehouse layer)
+    # The single-file writes are independent → run them in parallel threads.
+    # list(...) waits for all of them and re-raises any write error.
+    # Partitioned tables (pyarrow datasets) are written first, on the main
+    # thread, before the pool exists: ds.write_dataset hangs the process on
+    # exit otherwise (see write_warehouse_table).
     print("Writing Parquet files to data/warehouse/...")
 
-    dim_users.to_parquet(WAREHOUSE_DIR / "dim_users.parquet", index=False)
-    fct_transactions.to_parquet(WAREHOUSE_DIR / "fct_transactions.parquet", index=False)
-    fct_funnel.to_parquet(WAREHOUSE_DIR / "fct_funnel.parquet", index=False)
+    tables = {
+        "dim_users": dim_users,
+        "fct_transactions": fct_transactions,
+        "fct_funnel": fct_funnel,
+    }
+    single_file_tables = {
+        name: df for name, df in tables.items() if name not in WAREHOUSE_PARTITIONS
+    }
+    for name in WAREHOUSE_PARTITIONS:
+        write_warehouse_table(tables[name], name)
+    with ThreadPoolExecutor(max_workers=len(single_file_tables)) as executor:
+        list(executor.map(
+            write_warehouse_table, single_file_tables.values(), single_file_tables.keys()
+        ))
 
     print("✅ ETL completed successfully.")
     print("📁 Warehouse directory:", WAREHOUSE_DIR)
-    for file in WAREHOUSE_DIR.glob("*.parquet"):
+    for file in sorted(WAREHOUSE_DIR.glob("*.parquet")) + [
+        WAREHOUSE_DIR / name for name in WAREHOUSE_PARTITIONS
+    ]:
         print(" -", file.name)
 
 
@@ -1,22 +1,23 @@
 """
 Generate synthetic banking data for the Revolut Growth Analytics project.
 
-Creates 5 CSVs:
-- users.csv
-- kyc.csv
-- cards.csv
-- transactions.csv
-- funnel_events.csv
+Creates 5 Parquet files:
+- users.parquet
+- kyc.parquet
+- cards.parquet
+- transactions.parquet
+- funnel_events.parquet
 
 Stored in: data/raw/
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-import random
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
 
 # ----------------------------------------
@@ -25,6 +26,8 @@ from faker import Faker
 # Purpose:
 # - Ensure data ends up in the correct folder
 # - Make results reproducible for debugging / consistency
+# - All random values come from one seeded NumPy Generator, so every
+#   column is drawn in a single vectorized call instead of row by row
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 RAW_DIR = BASE_DIR / "data" / "raw"
@@ -32,8 +35,7 @@ RAW_DIR.mkdir(parents=True, exist_ok=True)
 
 fake = Faker()
 Faker.seed(42)
-np.random.seed(42)
-random.seed(42)
+rng = np.random.default_rng(42)
 
 # ----------------------------------------
 # 1. Users table
@@ -53,24 +55,22 @@ signup_start = datetime(2024, 1, 1)
 signup_end = datetime(2024, 12, 31)
 days_range = (signup_end - signup_start).days
 
-users = []
+user_ids = np.arange(1, N_USERS + 1)
 
-for user_id in range(1, N_USERS + 1):
-    # random signup timestamp
-    signup_date = signup_start + timedelta(
-        days=random.randint(0, days_range),
-        seconds=random.randint(0, 24 * 3600),
-    )
-    
-    users.append({
-        "user_id": user_id,
-        "signup_at": signup_date,
-        "country": random.choice(countries),
-        "device": random.choice(devices),
-        "marketing_channel": random.choice(channels)
-    })
+# random signup timestamp (random day + random second within that day)
+signup_at = (
+    pd.Timestamp(signup_start)
+    + pd.to_timedelta(rng.integers(0, days_range + 1, N_USERS), unit="D")
+    + pd.to_timedelta(rng.integers(0, 24 * 3600 + 1, N_USERS), unit="s")
+)
 
-users_df = pd.DataFrame(users)
+users_df = pd.DataFrame({
+    "user_id": user_ids,
+    "signup_at": signup_at,
+    "country": rng.choice(countries, N_USERS),
+    "device": rng.choice(devices, N_USERS),
+    "marketing_channel": rng.choice(channels, N_USERS),
+})
 
 # ----------------------------------------
 # 2. KYC + Funnel steps
@@ -81,63 +81,32 @@ users_df = pd.DataFrame(users)
 # Notes:
 # - Not every user completes the next step (drop-off simulation)
 # - KYC status is not always APPROVED (adds realism)
-
-kyc_rows = []
-funnel_rows = []
-
-for _, user in users_df.iterrows():
-    uid = user["user_id"]
-    signup_at = user["signup_at"]
-
-    # Funnel step: viewed signup page
-    funnel_rows.append({
-        "user_id": uid,
-        "step_order": 1,
-        "step_name": "VIEWED_SIGNUP",
-        "event_time": signup_at
-    })
-
-    # ~95% start registration
-    if random.random() < 0.95:
-        start_reg_at = signup_at + timedelta(minutes=random.randint(1, 60))
-        funnel_rows.append({
-            "user_id": uid,
-            "step_order": 2,
-            "step_name": "STARTED_REGISTRATION",
-            "event_time": start_reg_at
-        })
-    else:
-        continue  # user dropped out early
-
-    # ~85% proceed to KYC
-    if random.random() < 0.85:
-        kyc_start = start_reg_at + timedelta(minutes=random.randint(5, 120))
-        kyc_duration = random.randint(2, 60)
-        kyc_end = kyc_start + timedelta(minutes=kyc_duration)
-
-        # decide KYC outcome
-        r = random.random()
-        if r < 0.75:
-            status = "APPROVED"
-        elif r < 0.90:
-            status = "FAILED"
-        else:
-            status = "PENDING"
-
-        kyc_rows.append({
-            "user_id": uid,
-            "kyc_started_at": kyc_start,
-            "kyc_completed_at": kyc_end,
-            "kyc_status": status
-        })
-
-        # funnel step
-        funnel_rows.append({
-            "user_id": uid,
-            "step_order": 3,
-            "step_name": "KYC_COMPLETED",
-            "event_time": kyc_end
-        })
+# - Delays are drawn for every user at once; boolean masks then
+#   select the users who actually reached each step
+
+# ~95% start registration (the rest drop out early)
+started_registration = rng.random(N_USERS) < 0.95
+start_reg_at = signup_at + pd.to_timedelta(rng.integers(1, 61, N_USERS), unit="min")
+
+# ~85% of those proceed to KYC
+entered_kyc = started_registration & (rng.random(N_USERS) < 0.85)
+kyc_start = start_reg_at + pd.to_timedelta(rng.integers(5, 121, N_USERS), unit="min")
+kyc_end = kyc_start + pd.to_timedelta(rng.integers(2, 61, N_USERS), unit="min")
+
+# decide KYC outcome
+r = rng.random(N_USERS)
+kyc_status = np.select(
+    [r < 0.75, r < 0.90],
+    ["APPROVED", "FAILED"],
+    default="PENDING",
+)
+
+kyc_df = pd.DataFrame({
+    "user_id": user_ids[entered_kyc],
+    "kyc_started_at": kyc_start[entered_kyc],
+    "kyc_completed_at": kyc_end[entered_kyc],
+    "kyc_status": kyc_status[entered_kyc],
+})
 
 # ----------------------------------------
 # 3. Cards table
@@ -147,32 +116,22 @@ for _, user in users_df.iterrows():
 # - ~80% activate one (simulating real drop-off after approval)
 # - Important for conversion rate analytics
 
-cards = []
+approved = kyc_df[kyc_df["kyc_status"] == "APPROVED"]
+n_approved = len(approved)
 
-for kyc in kyc_rows:
-    if kyc["kyc_status"] != "APPROVED":
-        continue  # no card for non-approved users
+# 80% card activation rate
+activated = rng.random(n_approved) < 0.8
+activated_at = (
+    approved["kyc_completed_at"].to_numpy()
+    + pd.to_timedelta(rng.integers(0, 8, n_approved), unit="D")
+    + pd.to_timedelta(rng.integers(10, 181, n_approved), unit="min")
+)
 
-    if random.random() < 0.8:  # 80% card activation rate
-        activated_at = kyc["kyc_completed_at"] + timedelta(
-            days=random.randint(0, 7),
-            minutes=random.randint(10, 180)
-        )
-        
-        cards.append({
-            "user_id": kyc["user_id"],
-            "card_activated_at": activated_at,
-            "card_type": random.choice(["Virtual", "Physical"])
-        })
-
-        funnel_rows.append({
-            "user_id": kyc["user_id"],
-            "step_order": 4,
-            "step_name": "CARD_ACTIVATED",
-            "event_time": activated_at
-        })
-
-cards_df = pd.DataFrame(cards)
+cards_df = pd.DataFrame({
+    "user_id": approved["user_id"].to_numpy()[activated],
+    "card_activated_at": activated_at[activated],
+    "card_type": rng.choice(["Virtual", "Physical"], n_approved)[activated],
+})
 
 # ----------------------------------------
 # 4. Transactions table
@@ -182,8 +141,6 @@ cards_df = pd.DataFrame(cards)
 # - Users can make multiple transactions
 # - Amounts follow a lognormal distribution (more realistic)
 
-transactions = []
-
 categories = [
     "Groceries",
     "Restaurants",
@@ -193,49 +150,77 @@ categories = [
     "Subscriptions"
 ]
 
-for card in cards:
-    uid = card["user_id"]
-    
-    # simulate first top-up
-    first_topup = card["card_activated_at"] + timedelta(
-        hours=random.randint(1, 72)
-    )
+n_cards = len(cards_df)
+
+# simulate first top-up
+first_topup = cards_df["card_activated_at"].to_numpy() + pd.to_timedelta(
+    rng.integers(1, 73, n_cards), unit="h"
+)
+
+# ~70% make a top-up + transactions
+topped_up = rng.random(n_cards) < 0.7
+topup_user_ids = cards_df["user_id"].to_numpy()[topped_up]
+topup_at = first_topup[topped_up]
+
+transaction_types = ["CARD_PAYMENT", "ATM_WITHDRAWAL", "TRANSFER"]
+
+# simulate 1–20 transactions per user
+n_tx = rng.integers(1, 21, len(topup_user_ids))
+
+# Transactions are the biggest table, so they are never built as one big
+# DataFrame. Instead they are generated for a slice of users at a time
+# (~10 transactions per user → ~100k rows per chunk) and each chunk is
+# appended straight to the Parquet file as an Arrow RecordBatch.
+# → memory stays bounded no matter how large N_USERS gets
+TX_CHUNK_USERS = 10_000
+
+transactions_schema = pa.schema([
+    ("user_id", pa.int64()),
+    ("transaction_time", pa.timestamp("ns")),
+    ("amount_eur", pa.float64()),
+    ("category", pa.string()),
+    ("merchant_country", pa.string()),
+    ("transaction_type", pa.string()),
+])
+
+# Transaction times are built directly on int64 nanoseconds: one integer
+# multiply-add per row, no Timedelta objects in the chunk loop
+NS_PER_MINUTE = 60 * 1_000_000_000
+NS_PER_DAY = 24 * 60 * NS_PER_MINUTE
+
+topup_at_ns = topup_at.to_numpy(dtype="datetime64[ns]").view("i8")
+
+with pq.ParquetWriter(
+    RAW_DIR / "transactions.parquet",
+    transactions_schema,
+    compression="zstd",
+    use_dictionary=True,
+) as writer:
+    for start in range(0, len(topup_user_ids), TX_CHUNK_USERS):
+        chunk = slice(start, start + TX_CHUNK_USERS)
+        chunk_n_tx = n_tx[chunk]
+        chunk_rows = int(chunk_n_tx.sum())
+
+        # repeat each user's top-up time once per transaction
+        # ("explode" to one row per transaction), then add a random offset
+        tx_time_ns = (
+            np.repeat(topup_at_ns[chunk], chunk_n_tx)
+            + rng.integers(0, 91, chunk_rows) * NS_PER_DAY
+            + rng.integers(0, 24 * 60 + 1, chunk_rows) * NS_PER_MINUTE
+        )
 
-    # ~70% make a top-up + transactions
-    if random.random() < 0.7:
-
-        # funnel step
-        funnel_rows.append({
-            "user_id": uid,
-            "step_order": 5,
-            "step_name": "FIRST_TOPUP",
-            "event_time": first_topup
-        })
-
-        # simulate 1–20 transactions
-        n_tx = random.randint(1, 20)
-
-        for _ in range(n_tx):
-            tx_time = first_topup + timedelta(
-                days=random.randint(0, 90),
-                minutes=random.randint(0, 24 * 60)
-            )
-
-            # lognormal amount ~ realistic 5–80€
-            amount = round(np.random.lognormal(mean=3.0, sigma=0.6), 2)
-
-            transactions.append({
-                "user_id": uid,
-                "transaction_time": tx_time,
-                "amount_eur": amount,
-                "category": random.choice(categories),
-                "merchant_country": random.choice(countries),
-                "transaction_type": random.choice([
-                    "CARD_PAYMENT", "ATM_WITHDRAWAL", "TRANSFER"
-                ])
-            })
-
-transactions_df = pd.DataFrame(transactions)
+        writer.write_batch(pa.record_batch(
+            {
+                "user_id": np.repeat(topup_user_ids[chunk], chunk_n_tx),
+                "transaction_time": tx_time_ns.view("datetime64[ns]"),
+                # lognormal amount ~ realistic 5–80€
+                "amount_eur": rng.lognormal(mean=3.0, sigma=0.6, size=chunk_rows).round(2),
+                "category": rng.choice(categories, chunk_rows),
+                "merchant_country": rng.choice(countries, chunk_rows),
+                "transaction_type": rng.choice(transaction_types, chunk_rows),
+            },
+            schema=transactions_schema,
+        ))
 
 # ----------------------------------------
 # 5. Funnel events table
@@ -243,19 +228,72 @@ transactions_df = pd.DataFrame(transactions)
 # Purpose:
 # - Central table for funnel dashboards
 # - Contains: user_id, step order, step name, timestamp
+# - One block of rows per step, taken from the masks/timestamps above
+
+funnel_steps = [
+    (1, "VIEWED_SIGNUP", user_ids, signup_at),
+    (
+        2,
+        "STARTED_REGISTRATION",
+        user_ids[started_registration],
+        start_reg_at[started_registration],
+    ),
+    (3, "KYC_COMPLETED", kyc_df["user_id"], kyc_df["kyc_completed_at"]),
+    (4, "CARD_ACTIVATED", cards_df["user_id"], cards_df["card_activated_at"]),
+    (5, "FIRST_TOPUP", topup_user_ids, topup_at),
+]
 
-funnel_df = pd.DataFrame(funnel_rows)
+# Fixed column types for the funnel table; the total row count is known
+# from the steps above, so all rows are written into one preallocated
+# structured array (no per-step DataFrames, no dtype inference)
+funnel_dtype = np.dtype([
+    ("user_id", "i4"),
+    ("step_order", "i1"),
+    ("step_name", "U24"),
+    ("event_time", "datetime64[ns]"),
+])
+
+funnel_events = np.empty(
+    sum(len(step_user_ids) for _, _, step_user_ids, _ in funnel_steps),
+    dtype=funnel_dtype,
+)
+
+offset = 0
+for step_order, step_name, step_user_ids, step_times in funnel_steps:
+    rows = slice(offset, offset + len(step_user_ids))
+    funnel_events["user_id"][rows] = step_user_ids
+    funnel_events["step_order"][rows] = step_order
+    funnel_events["step_name"][rows] = step_name
+    funnel_events["event_time"][rows] = np.asarray(step_times, dtype="datetime64[ns]")
+    offset = rows.stop
+
+funnel_df = pd.DataFrame.from_records(funnel_events)
 
 # ----------------------------------------
-# 6. Save as CSV in data/raw/
+# 6. Save as Parquet in data/raw/
 # ----------------------------------------
-users_df.to_csv(RAW_DIR / "users.csv", index=False)
-pd.DataFrame(kyc_rows).to_csv(RAW_DIR / "kyc.csv", index=False)
-cards_df.to_csv(RAW_DIR / "cards.csv", index=False)
-transactions_df.to_csv(RAW_DIR / "transactions.csv", index=False)
-funnel_df.to_csv(RAW_DIR / "funnel_events.csv", index=False)
+# Purpose:
+# - Keep real dtypes (datetimes stay datetimes, no re-parsing in the ETL)
+# - Columnar + zstd compression → much smaller and faster than CSV
+# - Written straight through pyarrow (dictionary-encodes the repeated strings)
+# - transactions.parquet was already streamed to disk in step 4
+
+def write_raw_table(df, name):
+    """Write one raw DataFrame to data/raw/<name>.parquet."""
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        RAW_DIR / f"{name}.parquet",
+        compression="zstd",
+        use_dictionary=True,
+    )
+
+
+write_raw_table(users_df, "users")
+write_raw_table(kyc_df, "kyc")
+write_raw_table(cards_df, "cards")
+write_raw_table(funnel_df, "funnel_events")
 
 print("Fake banking data generated!")
 print("Saved to:", RAW_DIR)
-for file in RAW_DIR.glob("*.csv"):
+for file in RAW_DIR.glob("*.parquet"):
     print(" -", file.name)